@@ -3,14 +3,43 @@ import json
 import asyncio
 import aiohttp
 import logging
-import re
 import signal
-import traceback
+import socket
+import time
+from dataclasses import asdict, dataclass, fields
+from operator import attrgetter
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
-from telegram import Bot
-from typing import List, Dict, Any, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 import influxdb_client
-from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_client.client.write_api import WriteOptions
+
+try:
+    import orjson
+
+    def json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+
+    def json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
 
 # Load environment variables from the .env file
 load_dotenv()
@@ -20,8 +49,14 @@ VERSION = "1.0.6"
 STATUS_FILE = "status.json"
 CONFIG_FILE = "config.json"
 RETRY_TIMEOUT = 15  # Retry timeout in seconds
-REQUEST_DELAY = 2  # Delay between API requests
+VAST_RATE_LIMIT = 5  # Requests per second allowed for each API key
 API_TIMEOUT = 10  # Timeout for API requests in seconds
+MAX_CONCURRENT_ACCOUNTS = 4  # Fetch workers processing accounts in parallel
+MAX_CONCURRENT_REQUESTS = 4  # Vast.ai API requests in flight across all accounts
+TELEGRAM_MAX_ATTEMPTS = 3  # Attempts per message when Telegram rate limits us
+MAX_CONCURRENT_SENDS = 8  # Telegram messages in flight, well below the 30 msg/s limit
+NOTIFY_WORKERS = 4  # Workers draining the notification queue
+NOTIFY_QUEUE_SIZE = 256  # Pending notifications before producers wait
 
 CHECK_INTERVAL = int(os.getenv("CHECK_INTERVAL", 300))  # Default to 300 seconds
 VAST_URL = os.getenv("VAST_URL", "https://console.vast.ai/api/v0")
@@ -29,12 +64,108 @@ TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL", "https://api.telegram.org") + "
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
+# Translation table escaping every MarkdownV2 special character with a backslash
+MARKDOWN_ESCAPE_TABLE = str.maketrans({c: "\\" + c for c in r"_*[]()~`>#|+-={}.!"})
+
+# Numeric ServerSnapshot fields written to InfluxDB; rented stays a boolean field
+INFLUX_SERVER_FIELDS = (
+    "rented",
+    "rented_gpus",
+    "listed_gpu_cost",
+    "listed_storage_cost",
+    "min_bid_price",
+    "listed_min_gpu_count",
+    "earn_hour",
+    "earn_day",
+    "reliability",
+    "num_reports",
+    "listed_inet_down_cost",
+    "listed_inet_up_cost",
+    "running",
+    "resident",
+)
+_get_influx_fields = attrgetter(*INFLUX_SERVER_FIELDS)
+
+# Characters that must be backslash-escaped in InfluxDB line protocol tag values
+LINE_PROTOCOL_ESCAPE_TABLE = str.maketrans({c: "\\" + c for c in ", ="})
+
+# Reported setting changes: (icon, label, ServerSnapshot field, value formatter)
+CHANGE_SPECS: Tuple[Tuple[str, str, str, Callable[[Any], str]], ...] = (
+    ("💰", "price", "listed_gpu_cost", "{:.4f}$".format),
+    ("💾", "price", "listed_storage_cost", "{:.4f}$".format),
+    ("🎞", "min gpu", "listed_min_gpu_count", str),
+    ("🪫", "min bid", "min_bid_price", str),
+    ("🌐", "inet down", "listed_inet_down_cost", lambda v: f"{v*1024.0:.2f}$"),
+    ("🌐", "inet up", "listed_inet_up_cost", lambda v: f"{v*1024.0:.2f}$"),
+    ("🚨", "num reports", "num_reports", str),
+    ("🔍", "verification", "verification", str),
+)
+# Every field whose change ends up in a notification
+WATCHED_FIELDS = ("rented", "rented_gpus") + tuple(spec[2] for spec in CHANGE_SPECS)
+_get_watched = attrgetter(*WATCHED_FIELDS)
+
+
+@dataclass(slots=True)
+class ServerSnapshot:
+    """
+    State of a machine as of the last loop, persisted in status.json.
+    """
+
+    rented: bool = False
+    rented_gpus: int = 0
+    listed_gpu_cost: float = 0.0
+    listed_storage_cost: float = 0.0
+    min_bid_price: float = 0.0
+    listed_min_gpu_count: int = 0
+    earn_hour: float = 0.0
+    earn_day: float = 0.0
+    reliability: float = 0.0
+    num_reports: int = 0
+    gpu_occupancy: str = ""
+    listed_inet_down_cost: float = 0.0
+    listed_inet_up_cost: float = 0.0
+    running: int = 0
+    resident: int = 0
+    verification: str = ""
+
+    def watched(self) -> Tuple[Any, ...]:
+        """
+        Fields whose change is reported, compared in one shot before diffing.
+        """
+        return _get_watched(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ServerSnapshot":
+        # Missing keys (older status files) fall back to the defaults; null numbers
+        # do too, while strings keep None as the API reported it
+        values = {}
+        for f in fields(cls):
+            value = data.get(f.name, f.default)
+            if f.type is not str:
+                value = value or f.default
+            values[f.name] = value
+        return cls(**values)
+
+
 class VastAIBot:
+    # Parsed JSON files keyed by path, stored with the (mtime, size) they were read at
+    _json_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
     def __init__(self):
-        self.previous_status: Dict[str, Any] = {}
+        self.previous_status: Dict[int, ServerSnapshot] = {}
         self.vast_accounts: Dict[str, Any] = {}
+        # config.json as returned by load_json, to notice when it was reloaded
+        self.raw_accounts: Optional[Dict[str, Any]] = None
+        self.status_dirty: bool = False
         self.shutdown_event = asyncio.Event()
-        self.bot: Optional[Bot] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        self.default_recipients = frozenset({int(TELEGRAM_CHAT_ID)})
+        self.vast_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.rate_limiters: Dict[str, AsyncLimiter] = {}
+        # Last ETag and parsed body per (api_key, url) for conditional requests
+        self.http_cache: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+        self.notify_queue: asyncio.Queue = asyncio.Queue(maxsize=NOTIFY_QUEUE_SIZE)
 
         # Load InfluxDB parameters from .env
         self.influxdb_url = os.getenv("INFLUXDB_URL")
@@ -48,76 +179,178 @@ class VastAIBot:
             token=self.influxdb_token,
             org=self.influxdb_org,
         )
-        self.write_api = self.influx_client.write_api(write_options=SYNCHRONOUS)
+        # Batching mode: points are buffered and written by a background thread,
+        # with exponential backoff on transient failures
+        self.write_api = self.influx_client.write_api(
+            write_options=WriteOptions(
+                batch_size=5_000,
+                flush_interval=10_000,
+                jitter_interval=2_000,
+                retry_interval=5_000,
+                max_retries=5,
+                max_retry_delay=30_000,
+                exponential_base=2,
+            ),
+            error_callback=self.on_influxdb_error,
+            retry_callback=self.on_influxdb_retry,
+        )
+        self.pending_points: List[str] = []
 
     @staticmethod
-    def load_json(file_path: str) -> Dict[str, Any]:
+    def load_json(file_path: str, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Load a JSON file, reusing the parsed content while the file is unchanged.
+        With use_cache=False the file is always read and the cache is left untouched.
+        """
         try:
-            with open(file_path, "r") as f:
-                return json.load(f)
+            if not use_cache:
+                with open(file_path, "rb") as f:
+                    return json_loads(f.read())
+
+            st = os.stat(file_path)
+            key = (st.st_mtime_ns, st.st_size)
+            cached = VastAIBot._json_cache.get(file_path)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+            with open(file_path, "rb") as f:
+                data = json_loads(f.read())
+            VastAIBot._json_cache[file_path] = (key, data)
+            return data
         except FileNotFoundError:
-            logging.warning(f"JSON file not found: {file_path}")
+            logging.warning("JSON file not found: %s", file_path)
             return {}
         except json.JSONDecodeError:
-            logging.error(f"Invalid JSON in file: {file_path}")
+            logging.error("Invalid JSON in file: %s", file_path)
             return {}
 
+    @staticmethod
+    def clear_json_cache() -> None:
+        VastAIBot._json_cache.clear()
+
+    @staticmethod
+    def prepare_accounts(accounts: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize freshly loaded account settings, once per config load.
+        Invalid entries are logged and dropped so the other accounts keep running.
+        """
+        prepared: Dict[str, Any] = {}
+        for account_name, account_data in accounts.items():
+            try:
+                api_key = account_data["api_key"]  # required, raises if missing
+                machine_ids = frozenset(int(x) for x in account_data["machine_ids"])
+                prepared[account_name] = {
+                    **account_data,
+                    "api_key": api_key,
+                    "notify": frozenset(int(x) for x in account_data["notify"]),
+                    "machine_ids": machine_ids,
+                    "all_machines": -1 in machine_ids,
+                }
+            except Exception as e:
+                logging.error(
+                    "Skipping account %s, invalid config: %r", account_name, e
+                )
+        return prepared
+
     @staticmethod
     def save_json(file_path: str, data: Dict[str, Any]) -> None:
+        # Write to a temporary file first so a crash never leaves a truncated file
+        tmp_path = file_path + ".tmp"
         try:
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=4)
+            with open(tmp_path, "wb") as f:
+                f.write(json_dumps(data))
+            os.replace(tmp_path, file_path)
         except IOError as e:
-            logging.error(f"Error saving JSON to {file_path}: {e}")
+            logging.error("Error saving JSON to %s: %s", file_path, e)
 
     @staticmethod
     def escape_markdown(text: str) -> str:
-        escape_chars = r"_*[]()~`>#|+-={}.!"
-        return re.sub(f"([{re.escape(escape_chars)}])", r"\\\1", text)
+        return text.translate(MARKDOWN_ESCAPE_TABLE)
 
     async def send_telegram_message(
-        self, message: str, chat_ids: Optional[List[int]] = None
+        self, message: str, chat_ids: Optional[FrozenSet[int]] = None
     ) -> None:
-        recipients = {int(TELEGRAM_CHAT_ID)} if chat_ids is None else set(chat_ids)
+        recipients = self.default_recipients if chat_ids is None else chat_ids
 
-        logging.info(f"Sending message to {recipients}:\n{message}")
+        logging.info("Sending message to %s:\n%s", recipients, message)
 
-        tasks = [
-            self.bot.send_message(
-                chat_id=chat_id,
-                text=self.escape_markdown(message),
-                parse_mode="MarkdownV2",
+        text = self.escape_markdown(message)
+
+        async def send(chat_id: int) -> None:
+            async with self.send_semaphore:
+                try:
+                    await self.call_telegram_api(chat_id, text)
+                except Exception as e:
+                    logging.error(
+                        "Error sending Telegram message to %s: %s", chat_id, e
+                    )
+
+        await asyncio.gather(*(send(chat_id) for chat_id in recipients))
+
+    async def call_telegram_api(self, chat_id: int, text: str) -> None:
+        """
+        POST a sendMessage over the shared session, honouring 429 retry_after.
+        """
+        url = f"{TELEGRAM_API_URL}{TELEGRAM_BOT_TOKEN}/sendMessage"
+        payload = {"chat_id": chat_id, "text": text, "parse_mode": "MarkdownV2"}
+        for attempt in range(1, TELEGRAM_MAX_ATTEMPTS + 1):
+            async with self.session.post(url, json=payload) as response:
+                if response.status < 400:
+                    return
+                try:
+                    data = json_loads(await response.read())
+                except json.JSONDecodeError:
+                    data = {}
+                if response.status != 429:
+                    # Never surface the request URL, it embeds the bot token
+                    raise RuntimeError(
+                        f"Telegram error {response.status}: {data.get('description')}"
+                    )
+                retry_after = data.get("parameters", {}).get(
+                    "retry_after", RETRY_TIMEOUT
+                )
+            if attempt == TELEGRAM_MAX_ATTEMPTS:
+                break
+            logging.warning(
+                "Telegram rate limit for %s, retrying in %ss", chat_id, retry_after
             )
-            for chat_id in recipients
-        ]
-        await asyncio.gather(*tasks, return_exceptions=True)
-
-        # for chat_id in recipients:
-        #     try:
-        #         await self.bot.send_message(
-        #             chat_id=chat_id,
-        #             text=self.escape_markdown(message),
-        #             parse_mode="MarkdownV2",
-        #         )
-        #     except Exception as e:
-        #         logging.error(f"Error sending Telegram message to {chat_id}: {e}")
+            await asyncio.sleep(retry_after)
+        raise RuntimeError(f"Telegram rate limit persisted for {chat_id}")
 
     async def call_vast_api(
         self, url: str, api_key: str, session: aiohttp.ClientSession
     ) -> Dict[str, Any]:
+        """
+        GET a Vast.ai endpoint. The last ETag seen for the same key and URL is
+        sent, and a 304 response returns the previously parsed body.
+        """
         headers = {"Authorization": f"Bearer {api_key}"}
+        cache_key = (api_key, url)
+        cached = self.http_cache.get(cache_key)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+        # Token bucket per API key: accounts are throttled independently
+        limiter = self.rate_limiters.get(api_key)
+        if limiter is None:
+            limiter = self.rate_limiters[api_key] = AsyncLimiter(VAST_RATE_LIMIT, 1)
         try:
-            async with session.get(
-                url, headers=headers, timeout=API_TIMEOUT
+            async with limiter, self.vast_semaphore, session.get(
+                url, headers=headers
             ) as response:
                 response.raise_for_status()
-                return await response.json()
+                if response.status == 304 and cached is not None:
+                    return cached[1]
+                data = json_loads(await response.read())
+                etag = response.headers.get("ETag")
+                if etag:
+                    self.http_cache[cache_key] = (etag, data)
+                return data
         except aiohttp.ClientError as e:
-            logging.error(f"Error fetching {url}: {e}")
+            logging.error("Error fetching %s: %s", url, e)
         except json.JSONDecodeError as e:
-            logging.error(f"Invalid JSON response from {url}: {e}")
-        except Exception as e:
-            logging.error(f"Unexpected error: {traceback.format_exc()}")
+            logging.error("Invalid JSON response from %s: %s", url, e)
+        except Exception:
+            logging.exception("Unexpected error")
         return {}
 
     async def get_server_status(
@@ -137,68 +370,115 @@ class VastAIBot:
         return await self.call_vast_api(f"{VAST_URL}/user/earnings", api_key, session)
 
     def save_to_influxdb(
-        self, account_name: str, server_id: str, server_data: Dict[str, Any]
+        self, account_name: str, server_id: int, snapshot: ServerSnapshot
     ) -> None:
         """
-        Save numeric values of server data to InfluxDB.
+        Queue the numeric fields of a server snapshot for the next InfluxDB flush.
         """
-        points = []
-        for key, value in server_data.items():
-            if isinstance(value, (int, float)):  # Only save numeric values
-                point = (
-                    influxdb_client.Point("vastai")
-                    .tag("account_name", account_name)
-                    .tag("server_id", server_id)
-                    .field(key, value)
-                )
-                points.append(point)
-
-        try:
-            self.write_api.write(
-                bucket=self.influxdb_bucket, org=self.influxdb_org, record=points
-            )
-            logging.info(f"Data for server {server_id} saved to InfluxDB.")
-        except Exception as e:
-            logging.error(
-                f"Failed to write data to InfluxDB for server {server_id}: {e}"
-            )
+        self.queue_influxdb_point(
+            {"account_name": account_name, "server_id": str(server_id)},
+            zip(INFLUX_SERVER_FIELDS, _get_influx_fields(snapshot)),
+        )
 
     def save_earnings_to_influxdb(
         self, account_name: str, server_data: Dict[str, Any]
     ) -> None:
         """
-        Save numeric values of server data to InfluxDB.
+        Queue numeric values of account data for the next InfluxDB flush.
         """
-        points = []
-        for key, value in server_data.items():
-            if isinstance(value, (int, float)):  # Only save numeric values
-                point = (
-                    influxdb_client.Point("vastai")
-                    .tag("account_name", account_name)
-                    .field(key, value)
-                )
-                points.append(point)
+        self.queue_influxdb_point(
+            {"account_name": account_name},
+            (
+                (key, value)
+                for key, value in server_data.items()
+                if isinstance(value, (int, float))  # Only save numeric values
+            ),
+        )
 
+    @staticmethod
+    def format_field_value(value: Any) -> str:
+        # Same field types Point used to write, so existing series stay compatible
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, int):
+            return f"{value}i"
+        return repr(value)
+
+    def queue_influxdb_point(
+        self, tags: Dict[str, str], values: Iterable[Tuple[str, Any]]
+    ) -> None:
+        """
+        Queue one line-protocol record holding the given numeric values.
+        """
+        field_set = ",".join(
+            f"{key}={self.format_field_value(value)}"
+            for key, value in values
+            if value is not None
+        )
+        if not field_set:
+            return
+
+        tag_set = ",".join(
+            f"{key}={value.translate(LINE_PROTOCOL_ESCAPE_TABLE)}"
+            for key, value in tags.items()
+        )
+        self.pending_points.append(f"vastai,{tag_set} {field_set} {time.time_ns()}")
+
+    def flush_influxdb(self) -> None:
+        """
+        Hand every point queued during the loop to the batching write API; the
+        actual HTTP write happens on its background thread.
+        """
+        if not self.pending_points:
+            return
+
+        points, self.pending_points = self.pending_points, []
         try:
             self.write_api.write(
                 bucket=self.influxdb_bucket, org=self.influxdb_org, record=points
             )
-            logging.info(f"Data for account {account_name} saved to InfluxDB.")
+            logging.info("%d points queued for InfluxDB.", len(points))
         except Exception as e:
-            logging.error(
-                f"Failed to write data to InfluxDB for account {account_name}: {e}"
-            )
+            logging.error("Failed to write data to InfluxDB: %s", e)
+
+    @staticmethod
+    def on_influxdb_error(
+        conf: Tuple[str, str, str], data: str, exception: Exception
+    ) -> None:
+        logging.error("Failed to write data to InfluxDB: %s", exception)
+
+    @staticmethod
+    def on_influxdb_retry(
+        conf: Tuple[str, str, str], data: str, exception: Exception
+    ) -> None:
+        logging.warning("Retrying InfluxDB write: %s", exception)
+
+    @staticmethod
+    def format_server_line(
+        server_id: int, listed: bool, num_gpus: int, data: ServerSnapshot
+    ) -> str:
+        if listed:
+            price_info = f"💵{data.listed_gpu_cost:.2f} {data.min_bid_price:.2f} {data.listed_storage_cost:.2f}"
+        else:
+            price_info = "❌ NotList ❌"
+
+        status_str = f"✅" if data.rented else "❌"
+        gpu_status = f"{data.rented_gpus}/{num_gpus}"
+        # earning_info = f"💰{earn_hour:.2f}$ / {earn_day:.2f}$"
+        reliability_info = f"🎯{data.reliability*100:.2f}%"
+        running_info = (f"🗄️{data.resident}" if data.resident > 0 else "") + (
+            f"👤{data.running}" if data.rented else ""
+        )
+        return f"🖥️{server_id} {status_str}{gpu_status}«{data.listed_min_gpu_count} {price_info} {reliability_info} {running_info}\n"
 
     async def process_account(
         self,
         account_name: str,
         account_data: Dict[str, Any],
         session: aiohttp.ClientSession,
+        first_run: bool,
     ) -> None:
-        first_run = False if self.previous_status else True
-
-        messages: List[str] = []
-        account_lines: List[str] = []
+        account_rows: List[Tuple[int, bool, int, ServerSnapshot]] = []
         changes_lines: List[str] = []
 
         changes_detected = False
@@ -207,11 +487,12 @@ class VastAIBot:
         notify = account_data["notify"]
         server_ids = account_data["machine_ids"]
 
-        user = await self.get_current_user(api_key, session)
+        user, earnings, servers = await asyncio.gather(
+            self.get_current_user(api_key, session),
+            self.get_user_earnings(api_key, session),
+            self.get_server_status(api_key, session),
+        )
         balance: float = user.get("balance", 0)
-        await asyncio.sleep(1)  # try to prevent too many requests response
-
-        earnings = await self.get_user_earnings(api_key, session)
         machine_earnings = earnings.get("machine_earnings", 0) or 0.0
 
         # Save numeric values to InfluxDB
@@ -219,200 +500,198 @@ class VastAIBot:
             account_name, {"balance": balance, "machine_earnings": machine_earnings}
         )
 
-        await asyncio.sleep(1)  # try to prevent too many requests response
-
-        servers = await self.get_server_status(api_key, session)
-
-        all_server: bool = True if -1 in server_ids else False
+        # Accounts watching every machine (-1) skip the id filter entirely
+        if not account_data["all_machines"]:
+            servers = [server for server in servers if server.get("id") in server_ids]
 
         for server in servers:
-            server_id = str(server.get("id"))
-            if not all_server and int(server_id) not in server_ids:
-                continue
+            get = server.get  # bound once, every field below is read a single time
+            server_id: int = get("id")
 
-            listed: bool = server.get("listed", 0) or False
-            running: int = server.get("current_rentals_running", 0)
-            resident: int = server.get("current_rentals_resident", 0)
+            listed: bool = get("listed", 0) or False
+            running: int = get("current_rentals_running", 0)
+            resident: int = get("current_rentals_resident", 0)
             rented: bool = running > 0
-            reliability: float = server.get("reliability2", 0) or 0.0
-            num_gpus: int = server.get("num_gpus", 0)
-            earn_hour: float = server.get("earn_hour", 0) or 0.0
-            earn_day: float = server.get("earn_day", 0) or 0.0
-            gpu_occupancy: str = server.get("gpu_occupancy", "") or ""
-            listed_gpu_cost: float = 0.0
-            min_bid_price: float = 0.0
-            listed_storage_cost: float = 0.0
-            listed_inet_down_cost: float = 0.0
-            listed_inet_up_cost: float = 0.0
-            listed_min_gpu_count: int = 0
-            num_reports: int = server.get("num_reports", "") or 0
-            verification: str = server.get("verification", "None")
-
-            min_bid_price: float = server.get("min_bid_price", 0) or 0.0
+            reliability: float = get("reliability2", 0) or 0.0
+            num_gpus: int = get("num_gpus", 0)
+            earn_hour: float = get("earn_hour", 0) or 0.0
+            earn_day: float = get("earn_day", 0) or 0.0
+            gpu_occupancy: str = get("gpu_occupancy", "") or ""
+            num_reports: int = get("num_reports", "") or 0
+            verification: str = get("verification", "None")
+            min_bid_price: float = get("min_bid_price", 0) or 0.0
 
             if listed:
                 rented_gpus = gpu_occupancy.count("D") + gpu_occupancy.count("I")
-                listed_gpu_cost = server.get("listed_gpu_cost", 0) or 0.0
-                listed_storage_cost = server.get("listed_storage_cost", 0) or 0.0
-                listed_min_gpu_count = server.get("listed_min_gpu_count", 0) or 0
-                listed_inet_down_cost = server.get("listed_inet_down_cost", 0) or 0.0
-                listed_inet_up_cost = server.get("listed_inet_up_cost", 0) or 0.0
-                price_info = f"💵{listed_gpu_cost:.2f} {min_bid_price:.2f} {listed_storage_cost:.2f}"
+                listed_gpu_cost: float = get("listed_gpu_cost", 0) or 0.0
+                listed_storage_cost: float = get("listed_storage_cost", 0) or 0.0
+                listed_min_gpu_count: int = get("listed_min_gpu_count", 0) or 0
+                listed_inet_down_cost: float = get("listed_inet_down_cost", 0) or 0.0
+                listed_inet_up_cost: float = get("listed_inet_up_cost", 0) or 0.0
             else:
                 rented_gpus = running
-                price_info = "❌ NotList ❌"
+                listed_gpu_cost = 0.0
+                listed_storage_cost = 0.0
+                listed_min_gpu_count = 0
+                listed_inet_down_cost = 0.0
+                listed_inet_up_cost = 0.0
 
             status_str = f"✅" if rented else "❌"
-            gpu_status = f"{rented_gpus}/{num_gpus}"
-            # earning_info = f"💰{earn_hour:.2f}$ / {earn_day:.2f}$"
-            reliability_info = f"🎯{reliability*100:.2f}%"
-            running_info = (f"🗄️{resident}" if resident > 0 else "") + (
-                f"👤{running}" if rented else ""
+
+            new_data = ServerSnapshot(
+                rented=rented,
+                rented_gpus=rented_gpus,
+                listed_gpu_cost=listed_gpu_cost,
+                listed_storage_cost=listed_storage_cost,
+                min_bid_price=min_bid_price,
+                listed_min_gpu_count=listed_min_gpu_count,
+                earn_hour=earn_hour,
+                earn_day=earn_day,
+                reliability=reliability,
+                num_reports=num_reports,
+                gpu_occupancy=gpu_occupancy,
+                listed_inet_down_cost=listed_inet_down_cost,
+                listed_inet_up_cost=listed_inet_up_cost,
+                running=running,
+                resident=resident,
+                verification=verification,
             )
-            server_line = f"🖥️{server_id} {status_str}{gpu_status}«{listed_min_gpu_count} {price_info} {reliability_info} {running_info}\n"
 
             old_data = self.previous_status.get(server_id)
-            if old_data is not None:
-                p_listed_gpu_cost = old_data.get("listed_gpu_cost") or 0.0
-                p_listed_storage_cost = old_data.get("listed_storage_cost") or 0.0
-                p_rented = old_data.get("rented") or False
-                p_rented_gpus = old_data.get("rented_gpus") or 0
-                p_min_bid_price = old_data.get("min_bid_price") or 0.0
-                p_listed_min_gpu_count = old_data.get("listed_min_gpu_count") or 0.0
-                p_num_reports = old_data.get("num_reports") or 0
-                p_listed_inet_down_cost = old_data.get("listed_inet_down_cost") or 0.0
-                p_listed_inet_up_cost = old_data.get("listed_inet_up_cost") or 0.0
-                p_verification = old_data.get("verification", "")
-
-                p_gpu_status = f"{p_rented_gpus}/{num_gpus}"
-
-                if p_rented != rented or p_rented_gpus != rented_gpus:
-                    changes_detected = True
-                    ico_status = "🚀" if p_rented_gpus < rented_gpus else "🛬"
-                    changes_lines.append(
-                        f"{ico_status}{server_id} {status_str} {p_gpu_status} » {rented_gpus}/{num_gpus} = {(gpu_occupancy.replace(' ', ''))}\n"
-                    )
-
-                if p_listed_gpu_cost != listed_gpu_cost:
-                    changes_detected = True
-                    changes_lines.append(
-                        f"⚠️{server_id} 💰 price change, {p_listed_gpu_cost:.4f}$ » {listed_gpu_cost:.4f}$\n"
-                    )
-
-                if p_listed_storage_cost != listed_storage_cost:
-                    changes_detected = True
-                    changes_lines.append(
-                        f"⚠️{server_id} 💾 price change, {p_listed_storage_cost:.4f}$ » {listed_storage_cost:.4f}$\n"
-                    )
-
-                if p_listed_min_gpu_count != listed_min_gpu_count:
-                    changes_detected = True
-                    changes_lines.append(
-                        f"⚠️{server_id} 🎞 min gpu change, {p_listed_min_gpu_count} » {listed_min_gpu_count}\n"
-                    )
-
-                if p_min_bid_price != min_bid_price:
-                    changes_detected = True
-                    changes_lines.append(
-                        f"⚠️{server_id} 🪫 min bid change, {p_min_bid_price} » {min_bid_price}\n"
-                    )
-                if p_listed_inet_down_cost != listed_inet_down_cost:
-                    changes_detected = True
-                    changes_lines.append(
-                        f"⚠️{server_id} 🌐 inet down change, {p_listed_inet_down_cost*1024.0:.2f}$ » {listed_inet_down_cost*1024.0:.2f}$\n"
-                    )
-
-                if p_listed_inet_up_cost != listed_inet_up_cost:
-                    changes_detected = True
-                    changes_lines.append(
-                        f"⚠️{server_id} 🌐 inet up change, {p_listed_inet_up_cost*1024.0:.2f}$ » {listed_inet_up_cost*1024.0:.2f}$\n"
-                    )
+            if old_data is None:
+                changes_detected = True
+            elif new_data.watched() != old_data.watched():
+                changes_detected = True
 
-                if p_num_reports != num_reports:
-                    changes_detected = True
-                    changes_lines.append(
-                        f"⚠️{server_id} 🚨 num reports change, {p_num_reports} » {num_reports}\n"
-                    )
-                if p_verification != verification:
-                    changes_detected = True
+                p_rented_gpus = old_data.rented_gpus
+                if old_data.rented != rented or p_rented_gpus != rented_gpus:
+                    ico_status = "🚀" if p_rented_gpus < rented_gpus else "🛬"
                     changes_lines.append(
-                        f"⚠️{server_id} 🔍 verification change, {p_verification} » {verification}\n"
+                        f"{ico_status}{server_id} {status_str} {p_rented_gpus}/{num_gpus} » {rented_gpus}/{num_gpus} = {(gpu_occupancy.replace(' ', ''))}\n"
                     )
 
-            else:
-                changes_detected = True
+                for icon, label, field, fmt in CHANGE_SPECS:
+                    old_value = getattr(old_data, field)
+                    new_value = getattr(new_data, field)
+                    if old_value != new_value:
+                        changes_lines.append(
+                            f"⚠️{server_id} {icon} {label} change, {fmt(old_value)} » {fmt(new_value)}\n"
+                        )
 
-            self.previous_status[server_id] = {
-                "rented": rented,
-                "rented_gpus": rented_gpus,
-                "listed_gpu_cost": listed_gpu_cost,
-                "listed_storage_cost": listed_storage_cost,
-                "min_bid_price": min_bid_price,
-                "listed_min_gpu_count": listed_min_gpu_count,
-                "earn_hour": earn_hour,
-                "earn_day": earn_day,
-                "reliability": reliability,
-                "num_reports": num_reports,
-                "gpu_occupancy": gpu_occupancy,
-                "listed_inet_down_cost": listed_inet_down_cost,
-                "listed_inet_up_cost": listed_inet_up_cost,
-                "earn_hour": earn_hour,
-                "earn_day": earn_day,
-                "running": running,
-                "resident": resident,
-                "verification": verification,
-            }
+            if new_data != old_data:
+                self.status_dirty = True
+            self.previous_status[server_id] = new_data
 
             # Save numeric values to InfluxDB
-            self.save_to_influxdb(
-                account_name, server_id, self.previous_status[server_id]
-            )
+            self.save_to_influxdb(account_name, server_id, new_data)
 
-            account_lines.append(server_line)
+            account_rows.append((server_id, listed, num_gpus, new_data))
 
-        if changes_lines:
-            changes_lines.append(f"\n")
-
-        if (first_run or changes_detected) and account_lines:
-            messages.insert(
-                0,
+        if (first_run or changes_detected) and account_rows:
+            parts = [
                 f"👤 {account_name} 💰 {balance:.2f}$ 🏦 {machine_earnings:.2f}$\n\n"
-                + "".join(changes_lines)
-                + "".join(account_lines),
-            )
-
-            for message in messages:
-                await self.send_telegram_message(message, notify)
+            ]
+            if changes_lines:
+                parts.extend(changes_lines)
+                parts.append("\n")
+            # Server lines are only formatted when the message is actually sent
+            parts.extend(self.format_server_line(*row) for row in account_rows)
+
+            await self.notify_queue.put(("".join(parts), notify))
         else:
-            logging.info(f"👤 {account_name} No changes detected.")
+            logging.info("👤 %s No changes detected.", account_name)
 
-    async def monitor_servers(self) -> None:
-        async with aiohttp.ClientSession() as session:
+    async def fetch_worker(
+        self, fetch_queue: asyncio.Queue, session: aiohttp.ClientSession
+    ) -> None:
+        while True:
+            account_name, account_data, first_run = await fetch_queue.get()
             try:
-                while not self.shutdown_event.is_set():
-                    # Load the previous status and account data at each loop iteration to ensure they are up to date
-                    self.previous_status = self.load_json(STATUS_FILE)
-                    self.vast_accounts = self.load_json(CONFIG_FILE)
-
-                    for account_name, account_data in self.vast_accounts.items():
-                        await self.process_account(account_name, account_data, session)
+                await self.process_account(
+                    account_name, account_data, session, first_run
+                )
+            except Exception:
+                logging.exception("Error processing account %s", account_name)
+            finally:
+                fetch_queue.task_done()
 
-                        # try to prevent too many requests response
-                        await asyncio.sleep(2)
+    async def notify_worker(self) -> None:
+        while True:
+            message, chat_ids = await self.notify_queue.get()
+            try:
+                await self.send_telegram_message(message, chat_ids)
+            except Exception:
+                logging.exception("Error sending notification to %s", chat_ids)
+            finally:
+                self.notify_queue.task_done()
+
+    async def monitor_servers(self, session: aiohttp.ClientSession) -> None:
+        # Accounts are fetched by a pool of workers and notifications are sent by
+        # a separate pool, so a slow account or Telegram never blocks the others
+        fetch_queue: asyncio.Queue = asyncio.Queue()
+        workers = [
+            asyncio.create_task(self.fetch_worker(fetch_queue, session))
+            for _ in range(MAX_CONCURRENT_ACCOUNTS)
+        ]
+        workers.extend(
+            asyncio.create_task(self.notify_worker()) for _ in range(NOTIFY_WORKERS)
+        )
 
-                    self.save_json(STATUS_FILE, self.previous_status)
+        # The status is read once; from then on the in-memory copy is authoritative
+        # and status.json is only written back
+        # status.json keys are strings, in memory servers are keyed by their int id
+        self.previous_status = {
+            int(server_id): ServerSnapshot.from_dict(data)
+            for server_id, data in self.load_json(STATUS_FILE, use_cache=False).items()
+        }
 
-                    logging.info(
-                        f"Loop completed. Next loop in {CHECK_INTERVAL} seconds."
-                    )
+        try:
+            while not self.shutdown_event.is_set():
+                # The account config is re-checked each loop, load_json only
+                # parses it again when the file changed
+                accounts = self.load_json(CONFIG_FILE)
+                if accounts is not self.raw_accounts:
                     try:
-                        await asyncio.wait_for(
-                            self.shutdown_event.wait(), timeout=CHECK_INTERVAL
+                        self.vast_accounts = self.prepare_accounts(accounts)
+                    except Exception as e:
+                        logging.error(
+                            "Invalid %s, keeping previous accounts: %r", CONFIG_FILE, e
                         )
-                    except asyncio.TimeoutError:
-                        continue
-            finally:
-                await session.close()
+                    self.raw_accounts = accounts
+
+                first_run = not self.previous_status
+                for account_name, account_data in self.vast_accounts.items():
+                    fetch_queue.put_nowait((account_name, account_data, first_run))
+
+                await fetch_queue.join()
+                self.flush_influxdb()
+                await self.notify_queue.join()
+
+                if self.status_dirty:
+                    self.save_json(
+                        STATUS_FILE,
+                        {
+                            str(server_id): asdict(snapshot)
+                            for server_id, snapshot in self.previous_status.items()
+                        },
+                    )
+                    self.status_dirty = False
+
+                logging.info("Loop completed. Next loop in %s seconds.", CHECK_INTERVAL)
+                try:
+                    await asyncio.wait_for(
+                        self.shutdown_event.wait(), timeout=CHECK_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def handle_reload(self) -> None:
+        logging.info("Reload signal received, clearing JSON cache.")
+        self.clear_json_cache()
 
     def handle_shutdown(self) -> None:
         logging.info("Shutdown signal received.")
@@ -422,19 +701,43 @@ class VastAIBot:
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, self.handle_shutdown)
-
-        async with Bot(token=TELEGRAM_BOT_TOKEN, base_url=TELEGRAM_API_URL) as bot:
-            self.bot = bot
+        loop.add_signal_handler(signal.SIGHUP, self.handle_reload)
+
+        # A single session for the whole run, shared by Vast.ai and Telegram calls,
+        # keeps connections alive between loops
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=16,
+            ttl_dns_cache=600,
+            keepalive_timeout=75,
+            family=socket.AF_INET,  # avoid IPv6 fallback stalls on fresh connections
+            enable_cleanup_closed=True,
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+            headers={"User-Agent": f"VastAIBot/{VERSION}"},
+        ) as session:
+            self.session = session
             await self.send_telegram_message(f"🟢 VastAIBot v{VERSION}")
             try:
-                await self.monitor_servers()
+                await self.monitor_servers(session)
             finally:
                 await self.send_telegram_message(f"🔴 VastAIBot v{VERSION}")
+                # Closing the write API flushes whatever is still buffered
+                await asyncio.to_thread(self.write_api.close)
+                self.influx_client.close()
 
 
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s"
     )
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # uvloop is optional and unavailable on Windows
+        pass
     bot = VastAIBot()
     asyncio.run(bot.main())